@@ -0,0 +1,616 @@
+"""Behaviour checks for transaction_verifier that need no network access."""
+import asyncio
+import getpass
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+
+import transaction_verifier as tv
+
+# Batch mode needs the optional httpx dependency
+requires_httpx = pytest.mark.skipif(tv._import_httpx() is None, reason="httpx is not installed")
+
+
+def _fake_run_async(results):
+    """Builds a _run_async stand-in that discards the coroutine and returns results."""
+    def run(coro, use_uvloop=False):
+        coro.close()
+        return results
+    return run
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    tv._CACHE.clear()
+    yield
+    tv._CACHE.clear()
+
+
+@pytest.fixture
+def batch_file(tmp_path, monkeypatch):
+    """Writes a batch file and answers the secret key prompt."""
+    monkeypatch.setattr(getpass, 'getpass', lambda prompt='': 'sk_test')
+
+    def write(*lines):
+        path = tmp_path / 'refs.txt'
+        path.write_text(''.join(line + '\n' for line in lines), encoding='utf-8')
+        return str(path)
+    return write
+
+
+@pytest.fixture
+def interactive(monkeypatch):
+    """Runs the interactive loop, answering its prompts from a script."""
+    monkeypatch.setattr(getpass, 'getpass', lambda prompt='': 'sk_test')
+    monkeypatch.setattr(tv.sys, 'argv', ['transaction_verifier.py'])
+
+    def run(*answers):
+        replies = iter(answers)
+        monkeypatch.setattr('builtins.input', lambda prompt='': next(replies))
+        tv.main()
+    return run
+
+
+@requires_httpx
+def test_batch_reports_exceptions_containing_markup(batch_file, monkeypatch, capsys):
+    path = batch_file('first', 'second')
+    results = [RuntimeError('[/x] broke'), {'status': 'success', 'reference': 'second'}]
+    monkeypatch.setattr(tv, '_run_async', _fake_run_async(results))
+
+    tv.main_batch(path)
+
+    out = capsys.readouterr().out
+    assert '[/x] broke' in out
+    assert 'second' in out
+
+
+def test_cache_returns_successful_transactions():
+    data = {'status': 'success', 'reference': 'ref'}
+    tv._cache_put('Bearer sk', 'ref', data)
+
+    assert tv._cache_get('Bearer sk', 'ref') is data
+    assert tv._cache_get('Bearer other', 'ref') is None
+
+
+@pytest.mark.parametrize('data', [None, {}, {'status': 'failed'}, {'status': 'abandoned'}])
+def test_cache_skips_unsuccessful_transactions(data):
+    tv._cache_put('Bearer sk', 'ref', data)
+
+    assert tv._cache_get('Bearer sk', 'ref') is None
+    assert not tv._CACHE
+
+
+def test_cache_keys_do_not_contain_the_secret():
+    tv._cache_put('Bearer sk_live_secret', 'ref', {'status': 'success'})
+
+    (digest, reference), = tv._CACHE
+    assert 'sk_live_secret' not in digest
+    assert reference == 'ref'
+
+
+def test_cache_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(tv.time, 'monotonic', lambda: now[0])
+    tv._cache_put('Bearer sk', 'ref', {'status': 'success'})
+
+    now[0] += tv.CACHE_TTL - 1
+    assert tv._cache_get('Bearer sk', 'ref') is not None
+
+    now[0] += 1
+    assert tv._cache_get('Bearer sk', 'ref') is None
+    assert not tv._CACHE
+
+
+def test_cache_evicts_least_recently_used():
+    for i in range(tv.CACHE_MAX_ENTRIES):
+        tv._cache_put('Bearer sk', f'ref{i}', {'status': 'success'})
+    # Touch the oldest entry so the second oldest is evicted instead
+    assert tv._cache_get('Bearer sk', 'ref0') is not None
+
+    tv._cache_put('Bearer sk', 'new', {'status': 'success'})
+
+    assert len(tv._CACHE) == tv.CACHE_MAX_ENTRIES
+    assert tv._cache_get('Bearer sk', 'ref0') is not None
+    assert tv._cache_get('Bearer sk', 'ref1') is None
+    assert tv._cache_get('Bearer sk', 'new') is not None
+
+
+def _run_json(path, monkeypatch, capsys):
+    """Runs `--batch path --json` and returns (exit status, parsed stdout, stderr)."""
+    monkeypatch.setattr(tv, '_JSON_OUTPUT', False)
+    monkeypatch.setattr(tv.sys, 'argv', ['transaction_verifier.py', '--batch', path, '--json'])
+    try:
+        tv.main()
+        status = 0
+    except SystemExit as e:
+        status = e.code
+    captured = capsys.readouterr()
+    output = json.loads(captured.out) if captured.out else None
+    return status, output, captured.err
+
+
+@requires_httpx
+def test_json_output_has_one_entry_per_reference(batch_file, monkeypatch, capsys):
+    path = batch_file('good', 'missing', 'boom')
+    data = {'status': 'success', 'reference': 'good'}
+    monkeypatch.setattr(tv, '_run_async', _fake_run_async([data, None, RuntimeError('boom')]))
+
+    status, output, err = _run_json(path, monkeypatch, capsys)
+
+    assert status == 0
+    assert output == [
+        {'reference': 'good', 'data': data},
+        {'reference': 'missing', 'data': None},
+        {'reference': 'boom', 'data': None},
+    ]
+    assert 'boom' in err
+
+
+@requires_httpx
+def test_json_exits_nonzero_when_every_reference_fails(batch_file, monkeypatch, capsys):
+    path = batch_file('a', 'b')
+    monkeypatch.setattr(tv, '_run_async', _fake_run_async([None, RuntimeError('down')]))
+
+    status, output, _ = _run_json(path, monkeypatch, capsys)
+
+    assert status == 1
+    assert output == [{'reference': 'a', 'data': None}, {'reference': 'b', 'data': None}]
+
+
+@requires_httpx
+def test_json_empty_file_writes_empty_array(batch_file, monkeypatch, capsys):
+    path = batch_file('', '   ')
+
+    status, output, _ = _run_json(path, monkeypatch, capsys)
+
+    assert status == 1
+    assert output == []
+
+
+@requires_httpx
+def test_json_missing_file_exits_nonzero(tmp_path, monkeypatch, capsys):
+    status, output, err = _run_json(str(tmp_path / 'nope.txt'), monkeypatch, capsys)
+
+    assert status == 1
+    assert output is None
+    assert 'Could not read' in err
+
+
+@requires_httpx
+def test_json_empty_key_exits_nonzero(batch_file, monkeypatch, capsys):
+    path = batch_file('ref')
+    monkeypatch.setattr(getpass, 'getpass', lambda prompt='': '')
+
+    status, output, _ = _run_json(path, monkeypatch, capsys)
+
+    assert status == 1
+    assert output is None
+
+
+def _interrupted_getpass(prompt=''):
+    raise KeyboardInterrupt
+
+
+def _interrupted_run_async(coro, use_uvloop=False):
+    coro.close()
+    raise KeyboardInterrupt
+
+
+@requires_httpx
+@pytest.mark.parametrize('target, interrupted', [
+    ('getpass.getpass', _interrupted_getpass),
+    ('transaction_verifier._run_async', _interrupted_run_async),
+])
+def test_json_interrupted_exits_130(target, interrupted, batch_file, monkeypatch, capsys):
+    path = batch_file('ref')
+    monkeypatch.setattr(target, interrupted)
+
+    status, output, _ = _run_json(path, monkeypatch, capsys)
+
+    assert status == 130
+    assert output is None
+
+
+def test_json_requires_batch():
+    with pytest.raises(SystemExit):
+        tv.parse_args(['--json'])
+
+
+class _FakeResponse:
+    """Stands in for a streamed requests.Response."""
+
+    def __init__(self, content=b'', headers=None, error=None, status_code=200):
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.content = content
+        self.error = error
+        self.status_code = status_code
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def raise_for_status(self):
+        if self.error:
+            raise self.error
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f'{self.status_code} Error', response=self)
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeSession:
+    """Stands in for the shared requests.Session, returning a fixed response."""
+
+    def __init__(self, response):
+        self.headers = {'Authorization': 'Bearer sk'}
+        self.response = response
+
+    def get(self, url, **kwargs):
+        return self.response
+
+
+@pytest.mark.parametrize('header, too_large', [
+    (None, False),
+    ('512', False),
+    ('512, 512', False),
+    (str(tv.MAX_RESPONSE_BYTES), False),
+    (str(tv.MAX_RESPONSE_BYTES + 1), True),
+    ('512, 513', True),
+    ('abc', True),
+    ('\xb2', True),
+    ('-1', True),
+    ('', True),
+])
+def test_body_too_large(header, too_large):
+    headers = {} if header is None else {'content-length': header}
+
+    assert tv._body_too_large(_FakeResponse(headers=headers)) is too_large
+
+
+@pytest.mark.parametrize('response', [
+    _FakeResponse(b'{"status": true, "data": {"status": "success"}}'),
+    _FakeResponse(b'not json'),
+    _FakeResponse(headers={'Content-Length': '12, 13'}),
+    _FakeResponse(error=requests.exceptions.HTTPError('404')),
+])
+def test_fetch_always_closes_the_response(response):
+    tv._fetch_transaction(_FakeSession(response), 'ref')
+
+    assert response.closed
+
+
+def test_fetch_refuses_oversized_body_without_content_length(monkeypatch):
+    monkeypatch.setattr(tv, 'MAX_RESPONSE_BYTES', 10)
+    monkeypatch.setattr(tv, '_READ_CHUNK_BYTES', 4)
+    response = _FakeResponse(b'{"status": true, "data": {}}')
+
+    data, error, _ = tv._fetch_transaction(_FakeSession(response), 'ref')
+
+    assert data is None
+    assert 'too large' in error
+    assert response.closed
+
+
+@requires_httpx
+def test_async_refuses_oversized_streamed_body(monkeypatch, capsys):
+    httpx = tv._import_httpx()
+    monkeypatch.setattr(tv, 'MAX_RESPONSE_BYTES', 10)
+
+    async def body():
+        for _ in range(4):
+            yield b'{"status": '
+
+    async def verify():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await tv.verify_paystack_async(client, 'ref')
+
+    assert asyncio.run(verify()) is None
+    assert 'too large' in capsys.readouterr().out
+
+
+@requires_httpx
+def test_batch_reports_transport_errors_and_imports_httpx_once(monkeypatch, capsys):
+    httpx = tv._import_httpx()
+    imports = []
+    monkeypatch.setattr(tv, '_import_httpx', lambda: imports.append(1) or httpx)
+
+    def refuse(request):
+        raise httpx.ConnectError('refused', request=request)
+    client = httpx.AsyncClient
+    monkeypatch.setattr(httpx, 'AsyncClient', lambda **kwargs: client(transport=httpx.MockTransport(refuse), **kwargs))
+
+    results = asyncio.run(tv.run_batch('sk_test', ['a', 'b', 'c']))
+
+    assert results == [None, None, None]
+    assert len(imports) == 1
+    assert 'An error occurred (c): refused' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('body', [
+    b'not json',
+    b'null',
+    b'[]',
+    b'"x"',
+    b'{"status": true, "data": "x"}',
+    b'{"status": true, "data": []}',
+])
+def test_fetch_reports_invalid_json(body):
+    data, error, _ = tv._fetch_transaction(_FakeSession(_FakeResponse(body)), 'ref')
+
+    assert data is None
+    assert 'invalid response' in error
+    assert not tv._CACHE
+
+
+@requires_httpx
+@pytest.mark.parametrize('body', [b'not json', b'[]', b'{"status": true, "data": "x"}'])
+def test_async_reports_invalid_json(body, capsys):
+    httpx = tv._import_httpx()
+
+    async def verify():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await tv.verify_paystack_async(client, 'ref')
+
+    assert asyncio.run(verify()) is None
+    assert 'invalid response' in capsys.readouterr().out
+
+
+def test_batch_table_shows_references_literally(capsys):
+    data = {'status': 'success', 'reference': '[bold]paid[/bold]', 'channel': '[/y]'}
+
+    tv.display_batch_results(['[/x]', '[bold]paid[/bold]'], [None, data])
+
+    out = capsys.readouterr().out
+    assert '[/x]' in out
+    assert '[bold]paid[/bold]' in out
+    assert '[/y]' in out
+
+
+def test_details_table_shows_server_values_literally(capsys):
+    tv.display_results({'status': 'failed', 'reference': '[/x]', 'customer': {'email': '[red]a@b.c'}})
+
+    out = capsys.readouterr().out
+    assert '[/x]' in out
+    assert '[red]a@b.c' in out
+
+
+def test_interactive_queue_shows_references_literally(interactive, monkeypatch, capsys):
+    not_found = requests.exceptions.HTTPError('404 Client Error')
+    monkeypatch.setattr(tv._SESSION, 'get', lambda url, **kwargs: _FakeResponse(error=not_found))
+
+    interactive('okref [/x]', 'y', 'n')
+
+    out = capsys.readouterr().out
+    assert 'Queued reference: [/x]' in out
+    assert 'Invalid reference format' in out
+    assert 'Authorization' not in tv._SESSION.headers
+
+
+@requires_httpx
+def test_uvloop_flag_requires_uvloop(batch_file, monkeypatch, capsys):
+    path = batch_file('ref')
+    monkeypatch.setattr(tv, '_import_uvloop', lambda: None)
+    monkeypatch.setattr(tv, '_run_async', _fake_run_async([{'status': 'success'}]))
+
+    assert tv.main_batch(path, use_uvloop=True) == 1
+    assert 'uvloop 0.18' in capsys.readouterr().out
+
+
+@requires_httpx
+def test_batch_uses_default_loop_without_flag(batch_file, monkeypatch):
+    calls = []
+
+    def run(coro, use_uvloop=False):
+        coro.close()
+        calls.append(use_uvloop)
+        return [{'status': 'success'}]
+    monkeypatch.setattr(tv, '_run_async', run)
+
+    assert tv.main_batch(batch_file('ref')) == 0
+    assert calls == [False]
+
+
+@pytest.mark.parametrize('reference, valid', [
+    ('T123_abc.def=ghi-jk', True),
+    ('x' * 100, True),
+    ('x' * 101, False),
+    ('', False),
+    ('ref\n', False),
+    ('re f', False),
+    ('ref/../admin', False),
+    ('[/x]', False),
+])
+def test_reference_format(reference, valid):
+    assert bool(tv._REFERENCE_RE.fullmatch(reference)) is valid
+
+
+def test_invalid_reference_skips_the_network():
+    session = _FakeSession(None)
+    session.get = None  # Any request would fail loudly
+
+    assert tv._fetch_transaction(session, '[/x]') == (None, 'Error: Invalid reference format.', False)
+
+
+def test_split_references():
+    assert tv.split_references(' a, b\tc,,d ') == ['a', 'b', 'c', 'd']
+    assert tv.split_references(' , ') == []
+
+
+def test_read_references_skips_blank_lines(batch_file):
+    assert tv.read_references(batch_file('a', '', '  b  ', '\t')) == ['a', 'b']
+
+
+@requires_httpx
+def test_batch_survives_references_containing_markup(batch_file, monkeypatch, capsys):
+    httpx = tv._import_httpx()
+
+    def handler(request):
+        reference = request.url.path.rsplit('/', 1)[-1]
+        return httpx.Response(200, json={'status': True, 'data': {'status': 'success', 'reference': reference}})
+
+    client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, 'AsyncClient',
+        lambda **kwargs: client(transport=httpx.MockTransport(handler), **kwargs)
+    )
+
+    assert tv.main_batch(batch_file('good_ref', '[/x]')) == 0
+
+    out = capsys.readouterr().out
+    assert 'Error ([/x]): Invalid reference format.' in out
+    assert 'good_ref' in out
+
+
+def test_httpx_without_h2_counts_as_missing(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'h2', None)
+
+    assert tv._import_httpx() is None
+
+
+def test_batch_without_httpx_exits_nonzero(batch_file, monkeypatch, capsys):
+    monkeypatch.setattr(tv, '_import_httpx', lambda: None)
+
+    assert tv.main_batch(batch_file('ref')) == 1
+    assert "httpx[http2]" in capsys.readouterr().out
+
+
+def test_import_does_not_load_batch_or_ui_dependencies():
+    code = (
+        "import sys, transaction_verifier\n"
+        "loaded = [m for m in ('asyncio', 'httpx', 'uvloop', 'rich') if m in sys.modules]\n"
+        "print(','.join(loaded))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(tv.__file__))
+    )
+
+    assert result.stdout.strip() == ''
+
+
+def test_prefetches_make_one_short_attempt(interactive, monkeypatch, capsys):
+    timeouts = {}
+
+    def get(session_name):
+        def fake_get(url, timeout, **kwargs):
+            timeouts[url.rsplit('/', 1)[-1]] = (session_name, timeout)
+            return _FakeResponse(b'{"status": true, "data": {"status": "success"}}')
+        return fake_get
+    monkeypatch.setattr(tv._SESSION, 'get', get('main'))
+    monkeypatch.setattr(tv._PREFETCH_SESSION, 'get', get('prefetch'))
+
+    interactive('first second', 'y', 'n')
+
+    assert timeouts == {
+        'first': ('main', tv.REQUEST_TIMEOUT),
+        'second': ('prefetch', tv.PREFETCH_TIMEOUT),
+    }
+    assert tv._PREFETCH_SESSION.get_adapter(tv.PAYSTACK_API_URL).max_retries.total == 0
+    assert 'Authorization' not in tv._SESSION.headers
+    assert 'Authorization' not in tv._PREFETCH_SESSION.headers
+
+
+def test_failed_prefetch_is_verified_again(interactive, monkeypatch, capsys):
+    monkeypatch.setattr(tv._PREFETCH_SESSION, 'get', lambda url, **kwargs: _FakeResponse(status_code=429))
+
+    def main_get(url, **kwargs):
+        reference = url.rsplit('/', 1)[-1]
+        return _FakeResponse(b'{"status": true, "data": {"status": "success", "reference": "%s-retried"}}'
+                             % reference.encode())
+    monkeypatch.setattr(tv._SESSION, 'get', main_get)
+
+    interactive('first second', 'y', 'n')
+
+    out = capsys.readouterr().out
+    assert 'second-retried' in out
+    assert '429' not in out
+
+
+@pytest.mark.parametrize('status_code', [401, 404])
+def test_permanent_prefetch_failure_is_not_fetched_again(status_code, interactive, monkeypatch, capsys):
+    requested = []
+
+    def get(session_name):
+        def fake_get(url, **kwargs):
+            requested.append((session_name, url.rsplit('/', 1)[-1]))
+            return _FakeResponse(status_code=status_code)
+        return fake_get
+    monkeypatch.setattr(tv._SESSION, 'get', get('main'))
+    monkeypatch.setattr(tv._PREFETCH_SESSION, 'get', get('prefetch'))
+
+    interactive('first second third', 'y', 'y', 'n')
+
+    assert sorted(requested) == [('main', 'first'), ('prefetch', 'second'), ('prefetch', 'third')]
+    assert f'{status_code} Error' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('error, transient', [
+    (requests.exceptions.ConnectTimeout('slow'), True),
+    (requests.exceptions.ReadTimeout('slow'), True),
+    (requests.exceptions.ConnectionError('reset'), True),
+    (requests.exceptions.HTTPError('503 Error', response=_FakeResponse(status_code=503)), True),
+    (requests.exceptions.HTTPError('401 Error', response=_FakeResponse(status_code=401)), False),
+    (requests.exceptions.HTTPError('no response'), False),
+])
+def test_fetch_marks_transient_failures(error, transient):
+    outcome = tv._fetch_transaction(_FakeSession(_FakeResponse(error=error)), 'ref')
+
+    assert outcome[2] is transient
+
+
+def test_session_retry_policy():
+    retries = tv._build_session().get_adapter(tv.PAYSTACK_API_URL).max_retries
+
+    assert isinstance(retries, tv._BoundedRetry)
+    assert retries.total == 3
+    assert retries.backoff_factor == 0.5
+    assert set(retries.status_forcelist) == {429, 500, 502, 503, 504}
+    assert set(retries.allowed_methods) == {'GET'}
+    assert retries.respect_retry_after_header
+
+
+@pytest.mark.parametrize('header, wait', [
+    ('2', 2),
+    ('3600', tv.MAX_RETRY_AFTER),
+])
+def test_retry_after_is_clamped(header, wait, monkeypatch):
+    slept = []
+    monkeypatch.setattr(urllib3.util.retry.time, 'sleep', slept.append)
+    response = urllib3.HTTPResponse(status=503, headers={'Retry-After': header})
+    retries = tv._build_session().get_adapter(tv.PAYSTACK_API_URL).max_retries
+
+    # increment() returns a fresh Retry; it must keep the clamp
+    retries = retries.increment(method='GET', url='/', response=response)
+    retries.sleep(response)
+
+    assert isinstance(retries, tv._BoundedRetry)
+    assert slept == [wait]
+
+
+@pytest.mark.parametrize('term, colorterm, color_system', [
+    ('xterm-256color', None, '256'),
+    ('xterm-256color', 'truecolor', 'truecolor'),
+    ('dumb', None, None),
+    ('unknown', None, None),
+])
+def test_console_color_system_on_a_tty(term, colorterm, color_system, monkeypatch):
+    monkeypatch.setattr(tv, '_console', None)
+    monkeypatch.setattr(tv.sys.stdout, 'isatty', lambda: True, raising=False)
+    monkeypatch.setenv('TERM', term)
+    monkeypatch.delenv('FORCE_COLOR', raising=False)
+    if colorterm:
+        monkeypatch.setenv('COLORTERM', colorterm)
+    else:
+        monkeypatch.delenv('COLORTERM', raising=False)
+
+    assert tv._get_console().color_system == color_system
@@ -2,29 +2,284 @@
 
 This script uses the Paystack API to fetch and display the status and
 details of a given transaction reference. It prompts the user for their
-secret key and the transaction reference securely.
+secret key and the transaction reference securely. Many references can
+be verified concurrently by passing a file to `--batch`, optionally with
+`--json` for machine-readable output.
+
+Rich, asyncio, httpx and uvloop are imported lazily, so `--help` and the
+interactive verifier only load what they use, and `--json` runs never load
+Rich.
 """
-import getpass
+import argparse
+import hashlib
+import os
+import re
+import socket
 import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 import requests
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Faster JSON encoding and decoding, when available
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    import json
+    from json import loads as _json_loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+def _import_httpx():
+    """
+    Imports httpx for --batch; the interactive verifier works without it.
+
+    Returns:
+        module: httpx, or None unless it is installed with HTTP/2 support.
+    """
+    try:
+        import httpx
+        import h2  # noqa: F401 -- httpx needs it for http2=True
+    except ImportError:
+        return None
+    return httpx
+
+def _import_uvloop():
+    """
+    Imports the optional libuv-based event loop for --batch --uvloop.
 
-# Initialize Rich console for terminal output
-console = Console()
+    Returns:
+        module: uvloop, or None unless version 0.18+ (which has uvloop.run) is installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop if hasattr(uvloop, 'run') else None
+
+# Rich console for terminal output, created on first use by _get_console()
+_console = None
+# When True, results are written to stdout as JSON and rich is never imported
+_JSON_OUTPUT = False
+# httpx.HTTPError once run_batch has imported httpx; catches nothing before that
+_HTTPX_ERROR = ()
+
+# Shared default for missing nested objects; never mutated
+_EMPTY = {}
+# Display names for the common Paystack statuses, so they need no case conversion
+_STATUS_TITLE = {
+    'success': 'Success',
+    'failed': 'Failed',
+    'abandoned': 'Abandoned',
+    'reversed': 'Reversed',
+    'pending': 'Pending',
+}
 
 PAYSTACK_API_URL = "https://api.paystack.co/transaction/verify/"
 MAX_INPUT_ATTEMPTS = 3
+# Maximum number of HTTP/2 connections used in batch mode; each one
+# multiplexes many verifications as concurrent streams
+BATCH_MAX_CONNECTIONS = 4
+# How long (seconds) and how many successful verifications are kept in memory
+CACHE_TTL = 300
+CACHE_MAX_ENTRIES = 256
+
+# Successful verifications, keyed by (api key hash, reference).
+# Values are (timestamp, transaction data) tuples, oldest first.
+_CACHE = OrderedDict()
+# Guards _CACHE, which background prefetch threads also use
+_CACHE_LOCK = threading.Lock()
+# Characters Paystack allows in a transaction reference; anything else is a
+# guaranteed 4xx, so it is rejected without a network round-trip
+_REFERENCE_RE = re.compile(r'[A-Za-z0-9_.=-]{1,100}')
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (3.05, 20)
+# Background prefetches make a single attempt with a shorter read timeout.
+# The read timeout applies to each wait for data, not the whole request, so a
+# server trickling bytes can keep a worker (and so interpreter exit) going longer.
+PREFETCH_TIMEOUT = (3.05, 5)
+# Statuses that mean "try again later"; the main session retries them
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Longest single Retry-After wait honoured, in seconds; larger requests are clamped
+MAX_RETRY_AFTER = 5
+# Largest decoded response body accepted; bigger ones are refused, unread
+# when Content-Length says so and otherwise as soon as the limit is passed
+MAX_RESPONSE_BYTES = 1024 * 1024
+# Size of the pieces a streamed response body is read in
+_READ_CHUNK_BYTES = 64 * 1024
+# Exit status of a batch stopped with Ctrl+C (128 + SIGINT, as shells report it)
+_INTERRUPTED_STATUS = 130
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """An HTTPAdapter whose sockets disable Nagle's algorithm and use TCP keep-alive."""
+
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+class _BoundedRetry(Retry):
+    """A Retry that honours Retry-After but never sleeps longer than MAX_RETRY_AFTER."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
 
-def print_header():
-    """Prints a stylish header for the application."""
-    console.print(Panel(
+def _build_session(retry=True):
+    """
+    Builds a requests Session that keeps HTTPS connections to Paystack alive.
+
+    Reusing the session's connection pool means only the first verification
+    pays for DNS lookup, the TCP handshake and TLS negotiation.
+
+    Args:
+        retry (bool): Retry transient failures. Disabled for background
+            prefetches so they never outlive the prompt by much.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    if retry:
+        # Transient failures are retried on the same pooled connection, sleeping
+        # for as long as Paystack asks via Retry-After on 429/503 responses
+        # (up to MAX_RETRY_AFTER, so a huge value cannot hang the prompt)
+        retries = _BoundedRetry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=_TRANSIENT_STATUSES,
+            allowed_methods={'GET'},
+            respect_retry_after_header=True
+        )
+    else:
+        retries = 0
+    adapter = _KeepAliveAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+_SESSION = _build_session()
+# Used only by the background prefetch workers of the interactive loop
+_PREFETCH_SESSION = _build_session(retry=False)
+
+def _cache_key(credential, reference):
+    """Builds a cache key that does not hold on to the raw secret key."""
+    return (hashlib.sha256(credential.encode()).hexdigest()[:16], reference)
+
+def _cache_get(credential, reference):
+    """
+    Looks up a previously verified transaction.
+
+    Returns:
+        dict: The cached transaction data, or None if missing or expired.
+    """
+    key = _cache_key(credential, reference)
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+        if entry is None:
+            return None
+        timestamp, data = entry
+        if time.monotonic() - timestamp >= CACHE_TTL:
+            del _CACHE[key]
+            return None
+        _CACHE.move_to_end(key)
+        return data
+
+def _cache_put(credential, reference, data):
+    """
+    Remembers a verified transaction.
+
+    Only successful transactions are cached, since their records no longer
+    change; pending or failed ones may still be updated by Paystack.
+    """
+    if not data or data.get('status') != 'success':
+        return
+    key = _cache_key(credential, reference)
+    with _CACHE_LOCK:
+        _CACHE[key] = (time.monotonic(), data)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > CACHE_MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+
+def _get_console():
+    """Returns the shared Rich console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        if sys.stdout.isatty() and os.environ.get("TERM") not in ("dumb", "unknown"):
+            # Settle terminal and color support up front rather than probing
+            truecolor = os.environ.get("COLORTERM") in ("truecolor", "24bit")
+            _console = Console(
+                force_terminal=True,
+                color_system="truecolor" if truecolor else "256",
+                record=False
+            )
+        else:
+            # Leave detection to Rich so dumb terminals, FORCE_COLOR and
+            # friends keep working
+            _console = Console()
+    return _console
+
+@lru_cache(maxsize=None)
+def _style(definition):
+    """Parses a Rich style string once so repeated renders reuse it."""
+    from rich.style import Style
+    return Style.parse(definition)
+
+@contextmanager
+def _maybe_status(message):
+    """
+    Shows a Rich spinner while the block runs, but only on an interactive terminal.
+
+    Under CI logs, pipes or --json there is nobody to watch the animation, so
+    the Live renderer and its refresh thread are skipped entirely.
+    """
+    if _JSON_OUTPUT or not _get_console().is_terminal:
+        yield
+    else:
+        with _get_console().status(message):
+            yield
+
+def _print_error(message):
+    """
+    Prints an error in red, or as plain text on stderr in JSON mode.
+
+    Messages often carry references, server messages or exception text, so
+    they are never parsed as Rich markup.
+    """
+    if _JSON_OUTPUT:
+        print(message.strip(), file=sys.stderr)
+    else:
+        _get_console().print(message, style="bold red", markup=False)
+
+@lru_cache(maxsize=None)
+def _header_panel():
+    """Builds the header panel once; every later call returns the same object."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(
         Text("Paystack Transaction Verifier", justify="center", style="bold blue"),
         title="[bold green]Welcome[/bold green]",
         border_style="cyan"
-    ))
+    )
+
+def print_header():
+    """Prints a stylish header for the application."""
+    console = _get_console()
+    console.print(_header_panel())
     console.print()
 
 def get_user_input():
@@ -35,6 +290,9 @@ def get_user_input():
         tuple: A tuple containing (api_key, reference) or (None, None) if the user quits
                or fails to provide input after MAX_INPUT_ATTEMPTS.
     """
+    import getpass
+
+    console = _get_console()
     for attempt in range(MAX_INPUT_ATTEMPTS):
         try:
             console.print("\nType 'quit' or 'exit' at any time to leave.", style="dim yellow")
@@ -45,13 +303,13 @@ def get_user_input():
                 return (None, None)
 
             # Prompt for Reference
-            reference_prompt = "Enter the transaction reference: "
+            reference_prompt = "Enter the transaction reference(s): "
             reference = input(reference_prompt)
             if reference.lower() in ['quit', 'exit']:
                 return (None, None)
 
             # Check if input is valid
-            if api_key and reference:
+            if api_key and split_references(reference):
                 return (api_key, reference)
 
             # If input is invalid, print a warning
@@ -67,40 +325,307 @@ def get_user_input():
             return (None, None)
 
     # If the loop finishes, the user has run out of attempts
-    console.print("\nToo many failed attempts. Exiting.", style="bold red")
+    _print_error("\nToo many failed attempts. Exiting.")
     return (None, None)
 
-def verify_paystack(api_key, reference):
+def _body_too_large(response):
     """
-    Verifies a transaction using the Paystack API.
+    Checks the Content-Length header against MAX_RESPONSE_BYTES.
+
+    A missing header is allowed through. A malformed one, or a repeated
+    header with values that disagree, is treated as too large.
+    """
+    header = response.headers.get('Content-Length')
+    if header is None:
+        return False
+    lengths = {value.strip() for value in header.split(',')}
+    if len(lengths) != 1:
+        return True
+    length = lengths.pop()
+    # isdecimal(), unlike isdigit(), rejects characters such as '\xb2' that int() cannot parse
+    return not length.isdecimal() or int(length) > MAX_RESPONSE_BYTES
+
+def _add_chunk(body, chunk):
+    """
+    Appends a chunk of a streamed response body.
+
+    Returns:
+        bool: False once the body has grown past MAX_RESPONSE_BYTES.
+    """
+    body += chunk
+    return len(body) <= MAX_RESPONSE_BYTES
+
+def _decode_body(body):
+    """
+    Decodes a Paystack response body.
+
+    Raises:
+        ValueError: If the body is not JSON, is not an object, or has a
+            'data' field that is neither an object nor null.
+    """
+    data = _json_loads(body)
+    if not isinstance(data, dict) or not isinstance(data.get('data'), (dict, type(None))):
+        raise ValueError("unexpected response shape")
+    return data
+
+def set_api_key(session, api_key):
+    """
+    Attaches the Paystack secret key to every request sent through a session.
 
     Args:
+        session (requests.Session): The session to authorize.
         api_key (str): The user's Paystack secret key.
+    """
+    session.headers['Authorization'] = 'Bearer ' + api_key
+
+def clear_api_key(session):
+    """
+    Removes the Paystack secret key from a session once it is no longer needed.
+
+    Args:
+        session (requests.Session): The session to de-authorize.
+    """
+    session.headers.pop('Authorization', None)
+
+def _fetch_transaction(session, reference, timeout=REQUEST_TIMEOUT):
+    """
+    Fetches a transaction from the Paystack API without printing anything.
+
+    This is safe to run on a background thread while the user is at a prompt.
+
+    Args:
+        session (requests.Session): A session authorized with `set_api_key`.
         reference (str): The transaction reference.
+        timeout (tuple): The (connect, read) timeouts in seconds.
 
     Returns:
-        dict: The transaction data if successful, None otherwise.
+        tuple: (data, error, transient) where data is the transaction data if
+               successful (None otherwise), error is a message describing the
+               failure, and transient is True when the failure was a timeout,
+               a connection error or a status in _TRANSIENT_STATUSES, so that
+               trying again later may succeed.
     """
-    headers = {
-        'Authorization': f'Bearer {api_key}'
-    }
-    url = f"{PAYSTACK_API_URL}{reference}"
+    if not _REFERENCE_RE.fullmatch(reference):
+        return (None, "Error: Invalid reference format.", False)
+
+    credential = session.headers.get('Authorization', '')
+    cached = _cache_get(credential, reference)
+    if cached is not None:
+        return (cached, None, False)
 
     try:
-        with console.status("[bold green]Verifying with Paystack...[/]"):
-            response = requests.get(url, headers=headers, timeout=20)
+        # Stream so an oversized body can be refused before it is downloaded
+        response = session.get(PAYSTACK_API_URL + reference, timeout=timeout, stream=True)
+        try:
+            if _body_too_large(response):
+                return (None, "Error: Paystack response is too large.", False)
+            # Chunked or compressed bodies are not covered by Content-Length, so
+            # the decoded size is counted as it is read. Reading to the end lets
+            # the connection go back to the pool.
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=_READ_CHUNK_BYTES):
+                if not _add_chunk(body, chunk):
+                    return (None, "Error: Paystack response is too large.", False)
             response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
+        finally:
+            # Releases a fully read connection to the pool; discards a partly read one
+            response.close()
 
-        data = response.json()
+        # Error responses never reach here, so their bodies are not decoded
+        data = _decode_body(body)
         if data.get('status'):
+            _cache_put(credential, reference, data.get('data'))
+            return (data.get('data'), None, False)
+        else:
+            return (None, f"Error: {data.get('message')}", False)
+
+    except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+        return (None, f"An error occurred: {e}", True)
+    except requests.exceptions.RequestException as e:
+        response = getattr(e, 'response', None)
+        transient = response is not None and response.status_code in _TRANSIENT_STATUSES
+        return (None, f"An error occurred: {e}", transient)
+    except ValueError:
+        return (None, "Error: Paystack returned an invalid response.", False)
+
+def _report(outcome):
+    """Prints the error from a _fetch_transaction outcome, if any, and returns its data."""
+    data, error, _ = outcome
+    if error:
+        _print_error(error)
+    return data
+
+def verify_paystack(session, reference):
+    """
+    Verifies a transaction using the Paystack API.
+
+    Args:
+        session (requests.Session): A session authorized with `set_api_key`.
+        reference (str): The transaction reference.
+
+    Returns:
+        dict: The transaction data if successful, None otherwise.
+    """
+    with _maybe_status("[bold green]Verifying with Paystack...[/]"):
+        outcome = _fetch_transaction(session, reference)
+    return _report(outcome)
+
+async def verify_paystack_async(session, reference):
+    """
+    Verifies a transaction using the Paystack API without blocking.
+
+    Args:
+        session (httpx.AsyncClient): A client created with the
+            Authorization header already set.
+        reference (str): The transaction reference.
+
+    Returns:
+        dict: The transaction data if successful, None otherwise.
+    """
+    if not _REFERENCE_RE.fullmatch(reference):
+        _print_error(f"Error ({reference}): Invalid reference format.")
+        return None
+
+    credential = session.headers.get('Authorization', '')
+    cached = _cache_get(credential, reference)
+    if cached is not None:
+        return cached
+
+    try:
+        async with session.stream('GET', PAYSTACK_API_URL + reference) as response:
+            if _body_too_large(response):
+                _print_error(f"Error ({reference}): Paystack response is too large.")
+                return None
+            body = bytearray()
+            async for chunk in response.aiter_bytes(_READ_CHUNK_BYTES):
+                if not _add_chunk(body, chunk):
+                    _print_error(f"Error ({reference}): Paystack response is too large.")
+                    return None
+            response.raise_for_status()
+
+        data = _decode_body(body)
+
+        if data.get('status'):
+            _cache_put(credential, reference, data.get('data'))
             return data.get('data')
         else:
-            console.print(f"Error: {data.get('message')}", style="bold red")
+            _print_error(f"Error ({reference}): {data.get('message')}")
             return None
 
-    except requests.exceptions.RequestException as e:
-        console.print(f"An error occurred: {e}", style="bold red")
+    except _HTTPX_ERROR as e:
+        _print_error(f"An error occurred ({reference}): {e}")
         return None
+    except ValueError:
+        _print_error(f"Error ({reference}): Paystack returned an invalid response.")
+        return None
+
+async def run_batch(api_key, refs):
+    """
+    Verifies many transaction references concurrently.
+
+    Args:
+        api_key (str): The user's Paystack secret key.
+        refs (list): The transaction references to verify.
+
+    Returns:
+        list: One entry per reference, in the same order: the transaction data,
+              None if verification failed, or the exception that was raised.
+    """
+    import asyncio
+
+    global _HTTPX_ERROR
+
+    httpx = _import_httpx()
+    _HTTPX_ERROR = httpx.HTTPError
+    limits = httpx.Limits(
+        max_connections=BATCH_MAX_CONNECTIONS,
+        max_keepalive_connections=BATCH_MAX_CONNECTIONS
+    )
+    headers = {'Authorization': 'Bearer ' + api_key}
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=20.0, headers=headers) as session:
+        # One spinner for the whole batch rather than one per reference
+        with _maybe_status(f"[bold green]Verifying {len(refs)} transactions with Paystack...[/]"):
+            results = await asyncio.gather(
+                *[verify_paystack_async(session, ref) for ref in refs],
+                return_exceptions=True
+            )
+    return results
+
+def split_references(text):
+    """
+    Splits user input into transaction references.
+
+    Args:
+        text (str): One or more references separated by whitespace or commas.
+
+    Returns:
+        list: The references, in input order.
+    """
+    return text.replace(',', ' ').split()
+
+def _run_async(coro, use_uvloop=False):
+    """Runs a coroutine to completion, on uvloop when asked to."""
+    if use_uvloop:
+        return _import_uvloop().run(coro)
+    import asyncio
+
+    return asyncio.run(coro)
+
+def read_references(path):
+    """
+    Reads transaction references from a file, one per line.
+
+    Args:
+        path (str): Path to the file. Blank lines are ignored.
+
+    Returns:
+        list: The references, in file order.
+    """
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+# Labels of the displayed transaction fields, in the order _transaction_fields returns them
+_FIELD_LABELS = ("Status", "Reference", "Amount", "Customer Email", "Transaction Date", "Channel")
+
+def _make_table():
+    """Creates an empty, styled table for transaction details."""
+    from rich.table import Table
+
+    return Table(title="Paystack Transaction Details", style="cyan", title_style="bold magenta")
+
+def _transaction_fields(data):
+    """
+    Extracts the displayed values from a transaction.
+
+    Args:
+        data (dict): The dictionary containing transaction details.
+
+    Returns:
+        tuple: (row style, values) where values line up with _FIELD_LABELS.
+            The values are plain Text, so server-supplied strings are never
+            parsed as Rich markup.
+    """
+    from rich.text import Text
+
+    get = data.get
+    status = get('status', 'N/A')
+    # Paystack amount is in kobo (the smallest currency unit), so divide by 100
+    amount = get('amount', 0) / 100
+    currency = get('currency', '')
+    customer = get('customer') or _EMPTY
+
+    # Style the status based on the result for clear visual feedback
+    status_style = _style("bold green" if status == 'success' else "bold red")
+
+    values = (
+        _STATUS_TITLE.get(status) or status.title(),
+        get('reference', 'N/A'),
+        f"{amount:,.2f} {currency}",
+        customer.get('email', 'N/A'),
+        get('paid_at', get('created_at', 'N/A')),
+        get('channel', 'N/A'),
+    )
+    return status_style, tuple(Text('N/A' if value is None else str(value)) for value in values)
 
 def display_results(data):
     """
@@ -110,53 +635,221 @@ def display_results(data):
         data (dict): The dictionary containing transaction details.
     """
     if not data:
-        console.print("\nCould not retrieve transaction details.", style="bold red")
+        _print_error("\nCould not retrieve transaction details.")
         return
 
-    table = Table(title="Paystack Transaction Details", style="cyan", title_style="bold magenta")
+    table = _make_table()
     table.add_column("Field", style="green", no_wrap=True)
     table.add_column("Value", style="white")
 
-    status = data.get('status', 'N/A')
-    # Paystack amount is in kobo (the smallest currency unit), so divide by 100
-    amount = data.get('amount', 0) / 100
-    currency = data.get('currency', '')
-
-    table.add_row("Status", status.title())
-    table.add_row("Reference", data.get('reference', 'N/A'))
-    table.add_row("Amount", f"{amount:,.2f} {currency}")
-    table.add_row("Customer Email", data.get('customer', {}).get('email', 'N/A'))
-    table.add_row("Transaction Date", data.get('paid_at', data.get('created_at', 'N/A')))
-    table.add_row("Channel", data.get('channel', 'N/A'))
-
-    # Style the status row based on the result for clear visual feedback
-    if status == 'success':
-        table.rows[0].style = "bold green"
-    else:
-        table.rows[0].style = "bold red"
+    status_style, values = _transaction_fields(data)
+    rows = zip(_FIELD_LABELS, values)
+    table.add_row(*next(rows), style=status_style)
+    for label, value in rows:
+        table.add_row(label, value)
 
+    console = _get_console()
     console.print()
     console.print(table)
 
+def display_batch_results(refs, results):
+    """
+    Displays many transactions as rows of a single table.
+
+    Building one table and printing it once means Rich lays out the columns
+    a single time, however many references were verified.
+
+    Args:
+        refs (list): The transaction references that were verified.
+        results (list): The transaction data for each reference, or None.
+    """
+    from rich.text import Text
+
+    table = _make_table()
+    for label in _FIELD_LABELS:
+        table.add_column(label, style="white", no_wrap=(label == "Reference"))
+
+    failure_style = _style("bold red")
+    for ref, data in zip(refs, results):
+        if data:
+            status_style, values = _transaction_fields(data)
+            table.add_row(*values, style=status_style)
+        else:
+            table.add_row("Unverified", Text(ref), "N/A", "N/A", "N/A", "N/A", style=failure_style)
+
+    console = _get_console()
+    console.print()
+    console.print(table, crop=False)
+
+def parse_args(argv=None):
+    """Parses the command-line arguments."""
+    parser = argparse.ArgumentParser(description="Verify Paystack transactions.")
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        help="verify every reference listed in FILE (one per line) concurrently"
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help="with --batch, write the results to stdout as JSON instead of tables"
+    )
+    parser.add_argument(
+        '--uvloop',
+        action='store_true',
+        help="with --batch, run on the uvloop event loop (requires uvloop 0.18+)"
+    )
+    args = parser.parse_args(argv)
+    if args.json and not args.batch:
+        parser.error("--json can only be used with --batch")
+    if args.uvloop and not args.batch:
+        parser.error("--uvloop can only be used with --batch")
+    return args
+
+def main_batch(path, use_uvloop=False):
+    """
+    Verifies every reference in a file and displays the results.
+
+    Args:
+        path (str): Path to the file of references.
+        use_uvloop (bool): Run the batch on the uvloop event loop.
+
+    Returns:
+        int: The process exit status: 0 if at least one reference was
+             verified, 1 if the batch could not run or every reference failed,
+             _INTERRUPTED_STATUS if it was stopped with Ctrl+C.
+    """
+    if _import_httpx() is None:
+        _print_error("Batch mode requires httpx: pip install 'httpx[http2]'")
+        return 1
+    if use_uvloop and _import_uvloop() is None:
+        _print_error("--uvloop requires uvloop 0.18 or newer: pip install 'uvloop>=0.18'")
+        return 1
+
+    try:
+        refs = read_references(path)
+    except OSError as e:
+        _print_error(f"Could not read {path}: {e}")
+        return 1
+
+    if not refs:
+        _print_error(f"No references found in {path}.")
+        if _JSON_OUTPUT:
+            sys.stdout.buffer.write(_json_dumps([]) + b"\n")
+        return 1
+
+    import getpass
+
+    try:
+        api_key = getpass.getpass(prompt="Enter your Paystack Secret Key: ")
+    except KeyboardInterrupt:
+        return _INTERRUPTED_STATUS
+    except EOFError:
+        return 1
+    if not api_key:
+        _print_error("API Key cannot be empty.")
+        return 1
+
+    try:
+        results = _run_async(run_batch(api_key, refs), use_uvloop)
+    except KeyboardInterrupt:
+        # Partial results are not written, so scripts must not see success
+        return _INTERRUPTED_STATUS
+    for i, (ref, result) in enumerate(zip(refs, results)):
+        if isinstance(result, Exception):
+            _print_error(f"An error occurred ({ref}): {result}")
+            results[i] = None
+
+    if _JSON_OUTPUT:
+        output = [{'reference': ref, 'data': result} for ref, result in zip(refs, results)]
+        sys.stdout.buffer.write(_json_dumps(output) + b"\n")
+    else:
+        display_batch_results(refs, results)
+
+    return 0 if any(results) else 1
+
 def main():
     """Main function to run the verifier tool."""
-    print_header()
-
-    while True:
-        # Get input
-        api_key, reference = get_user_input()
+    global _JSON_OUTPUT
+
+    args = parse_args()
+    if args.json:
+        # Keep stdout clean for the JSON document
+        _JSON_OUTPUT = True
+        status = main_batch(args.batch, args.uvloop)
+        if status:
+            sys.exit(status)
+        return
 
-        # If the function returns None, the user wants to quit or has failed.
-        if not api_key:
-            break
+    print_header()
+    console = _get_console()
 
-        result_data = verify_paystack(api_key, reference)
-        display_results(result_data)
+    if args.batch:
+        status = main_batch(args.batch, args.uvloop)
+        console.print("Goodbye!", style="bold blue")
+        if status:
+            sys.exit(status)
+        return
 
-        console.print("\n----------------------------------------\n", style="dim")
-        again = input("Do you want to verify another transaction? (y/n): ").lower()
-        if again != 'y':
-            break
+    # References queued by entering several at once, each paired with a
+    # future that is already fetching it in the background
+    queue = deque()
+    executor = None
+    try:
+        while True:
+            if queue:
+                reference, future = queue.popleft()
+                console.print(f"\nQueued reference: {reference}", style="dim yellow", markup=False)
+                with _maybe_status("[bold green]Verifying with Paystack...[/]"):
+                    outcome = future.result()
+                if outcome[2]:
+                    # The prefetch was a single short attempt; a transient failure
+                    # gets the same retries and timeout as a reference entered on its own
+                    result_data = verify_paystack(_SESSION, reference)
+                else:
+                    result_data = _report(outcome)
+            else:
+                # Get input
+                api_key, reference = get_user_input()
+
+                # If the function returns None, the user wants to quit or has failed.
+                if not api_key:
+                    break
+
+                set_api_key(_SESSION, api_key)
+                set_api_key(_PREFETCH_SESSION, api_key)
+                # The sessions now hold the only references the loop needs
+                del api_key
+                reference, *queued = split_references(reference)
+                if queued:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=2)
+                    queue.extend(
+                        (ref, executor.submit(_fetch_transaction, _PREFETCH_SESSION, ref, PREFETCH_TIMEOUT))
+                        for ref in queued
+                    )
+                result_data = verify_paystack(_SESSION, reference)
+
+            display_results(result_data)
+
+            console.print("\n----------------------------------------\n", style="dim")
+            if queue:
+                prompt = f"Show the next queued transaction? ({len(queue)} left) (y/n): "
+            else:
+                prompt = "Do you want to verify another transaction? (y/n): "
+            first = (input(prompt) or 'n')[:1]
+            if first not in ('y', 'Y'):
+                break
+    finally:
+        if executor is not None:
+            # Queued fetches that have not started are dropped. At most two
+            # running ones finish first (no retries; each read waits up to
+            # PREFETCH_TIMEOUT for data), and they still carry the key they were sent with.
+            for _, future in queue:
+                future.cancel()
+            executor.shutdown(wait=False)
+        clear_api_key(_SESSION)
+        clear_api_key(_PREFETCH_SESSION)
 
     console.print("Goodbye!", style="bold blue")
 
@@ -166,5 +859,6 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         # Catch Ctrl+C on the "verify another" prompt
-        console.print("\nGoodbye!", style="bold blue")
+        if not _JSON_OUTPUT:
+            _get_console().print("\nGoodbye!", style="bold blue")
         sys.exit(0)